@@ -0,0 +1,33 @@
+# src/build_themes.py
+import argparse
+import os
+import sys
+from core.theme_builder import build_themes
+
+def main(argv=None):
+    themes_dir = os.path.join(os.path.dirname(__file__), 'resources', 'themes')
+    cache_dir = os.path.join(os.path.dirname(__file__), 'resources', 'theme_cache')
+
+    parser = argparse.ArgumentParser(description="Validate themes and pre-render their stylesheets.")
+    parser.add_argument("--themes-dir", default=themes_dir, help="Directory containing the theme XML files.")
+    parser.add_argument("--cache-dir", default=cache_dir, help="Directory the cache artifacts are written to.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes.")
+    parser.add_argument("--force", action="store_true", help="Rebuild themes even if their XML is unchanged.")
+    parser.add_argument("--min-contrast", type=float, default=3.0, help="Minimum text/background contrast ratio.")
+    args = parser.parse_args(argv)
+
+    manifest, rebuilt = build_themes(args.themes_dir, args.cache_dir, args.jobs, args.force, args.min_contrast)
+
+    failed = 0
+    for name in sorted(manifest):
+        errors = manifest[name]["errors"]
+        if errors:
+            failed += 1
+            for error in errors:
+                print(f"{name}: {error}")
+
+    print(f"Rebuilt {len(rebuilt)} of {len(manifest)} themes, {failed} invalid")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
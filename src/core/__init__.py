@@ -1,2 +1,3 @@
 from .settings import Settings
-from .theme_manager import ThemeManager
\ No newline at end of file
+from .theme_manager import ThemeManager
+from .panel_registry import PanelRegistry
\ No newline at end of file
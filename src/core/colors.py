@@ -0,0 +1,5 @@
+# src/core/colors.py
+import re
+
+# The only color form qt_material's templates accept
+COLOR_PATTERN = re.compile(r'^#[0-9a-fA-F]{6}$')
\ No newline at end of file
@@ -0,0 +1,151 @@
+# src/core/palette.py
+import numpy as np
+from core.colors import COLOR_PATTERN
+
+BLACK = "#000000"
+WHITE = "#ffffff"
+
+_HEX_TABLE = np.array([f"{i:02x}" for i in range(256)])
+
+def hex_to_rgb(colors):
+    """
+    Convert hex colors to an RGB array.
+
+    Args:
+        colors (_type_): A sequence of colors in '#rrggbb' form.
+
+    Raises:
+        ValueError: If any color is not of the form '#rrggbb'.
+
+    Returns:
+        np.ndarray: A (N, 3) float array of channels between 0 and 255.
+    """
+    colors = [color.strip() for color in colors]
+    invalid = [color for color in colors if not COLOR_PATTERN.match(color)]
+    if invalid:
+        raise ValueError(f"Colors must be of the form '#rrggbb': {', '.join(map(repr, invalid))}")
+
+    digits = ''.join(color[1:] for color in colors)
+    return np.frombuffer(bytes.fromhex(digits), dtype=np.uint8).reshape(-1, 3).astype(np.float64)
+
+def rgb_to_hex(rgb):
+    """
+    Convert an RGB array to hex colors.
+
+    Args:
+        rgb (np.ndarray): A (N, 3) array of channels between 0 and 255.
+
+    Returns:
+        np.ndarray: A (N,) array of colors in '#rrggbb' form.
+    """
+    channels = np.clip(np.rint(rgb), 0, 255).astype(np.intp)
+    hex_channels = _HEX_TABLE[channels]
+    return np.char.add(np.char.add(np.char.add('#', hex_channels[:, 0]), hex_channels[:, 1]), hex_channels[:, 2])
+
+def mix(rgb, target, amount):
+    """
+    Mix colors towards a target color.
+
+    Args:
+        rgb (np.ndarray): A (N, 3) array of colors.
+        target (float): The channel value to mix towards, 0 for black and 255 for white.
+        amount (float): The mix amount between 0 and 1.
+
+    Returns:
+        np.ndarray: The mixed (N, 3) array.
+    """
+    return rgb + (target - rgb) * amount
+
+def relative_luminance(rgb):
+    """
+    Compute the WCAG relative luminance of colors.
+
+    Args:
+        rgb (np.ndarray): A (N, 3) array of colors.
+
+    Returns:
+        np.ndarray: A (N,) array of luminances between 0 and 1.
+    """
+    c = rgb / 255
+    linear = np.where(c <= 0.03928, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+def contrast_ratio(foreground, background):
+    """
+    Compute the WCAG contrast ratio between pairs of colors.
+
+    Args:
+        foreground (np.ndarray): A (N, 3) array of foreground colors.
+        background (np.ndarray): A (N, 3) array of background colors.
+
+    Returns:
+        np.ndarray: A (N,) array of contrast ratios between 1 and 21.
+    """
+    foreground_luminance = relative_luminance(foreground)
+    background_luminance = relative_luminance(background)
+    lighter = np.maximum(foreground_luminance, background_luminance)
+    darker = np.minimum(foreground_luminance, background_luminance)
+    return (lighter + 0.05) / (darker + 0.05)
+
+def text_colors(rgb):
+    """
+    Pick black or white text for backgrounds, whichever has the higher contrast.
+
+    Args:
+        rgb (np.ndarray): A (N, 3) array of background colors.
+
+    Returns:
+        np.ndarray: A (N,) array of text colors in '#rrggbb' form.
+    """
+    luminance = relative_luminance(rgb)
+    # Contrast against black is (L + 0.05) / 0.05, against white 1.05 / (L + 0.05)
+    black_wins = (luminance + 0.05) ** 2 > 1.05 * 0.05
+    return np.where(black_wins, BLACK, WHITE)
+
+def generate_palettes(primary, secondary, light_amount=0.3, dark_amount=0.15):
+    """
+    Derive the full theme color set for many themes at once.
+
+    Args:
+        primary (_type_): A sequence of primary colors in '#rrggbb' form.
+        secondary (_type_): A sequence of secondary colors in '#rrggbb' form.
+        light_amount (float, optional): How far light variants mix towards white. Defaults to 0.3.
+        dark_amount (float, optional): How far dark variants mix towards black. Defaults to 0.15.
+
+    Raises:
+        ValueError: If primary and secondary differ in length or contain a color not of the form '#rrggbb'.
+
+    Returns:
+        dict: The color name mapped to a (N,) array of colors per theme.
+    """
+    if len(primary) != len(secondary):
+        raise ValueError("primary and secondary must have the same length")
+
+    primary_rgb = hex_to_rgb(primary)
+    secondary_rgb = hex_to_rgb(secondary)
+
+    return {
+        "primaryColor": rgb_to_hex(primary_rgb),
+        "primaryLightColor": rgb_to_hex(mix(primary_rgb, 255, light_amount)),
+        "secondaryColor": rgb_to_hex(secondary_rgb),
+        "secondaryLightColor": rgb_to_hex(mix(secondary_rgb, 255, light_amount)),
+        "secondaryDarkColor": rgb_to_hex(mix(secondary_rgb, 0, dark_amount)),
+        "primaryTextColor": text_colors(primary_rgb),
+        "secondaryTextColor": text_colors(secondary_rgb)
+    }
+
+def generate_palette(primary, secondary, light_amount=0.3, dark_amount=0.15):
+    """
+    Derive the full theme color set for a single theme.
+
+    Args:
+        primary (str): The primary color in '#rrggbb' form.
+        secondary (str): The secondary color in '#rrggbb' form.
+        light_amount (float, optional): How far light variants mix towards white. Defaults to 0.3.
+        dark_amount (float, optional): How far dark variants mix towards black. Defaults to 0.15.
+
+    Returns:
+        dict: The color name mapped to its '#rrggbb' value.
+    """
+    palettes = generate_palettes([primary], [secondary], light_amount, dark_amount)
+    return {name: str(colors[0]) for name, colors in palettes.items()}
@@ -0,0 +1,196 @@
+# src/core/panel_registry.py
+import importlib
+import time
+
+class PanelRegistry:
+    def __init__(self, host=None):
+        """
+        Constructor for the PanelRegistry class.
+
+        Panels and dialogs are declared by a "module.path:ClassName" target and
+        are only imported and constructed the first time they are requested.
+
+        Args:
+            host (callable, optional): Called once with the name and instance of every new
+                non-dialog panel to place it in the window. Defaults to None.
+        """
+        self.host = host
+        self._entries = {}
+        self._instances = {}
+        self._entry_point_groups = []
+        self.timings = {}
+
+    def register(self, name, target, args=(), kwargs=None, setup=None, cache=True):
+        """
+        Declare a panel without importing it.
+
+        Args:
+            name (str): The name used to look up the panel.
+            target (str): The "module.path:ClassName" of the panel class.
+            args (tuple, optional): Positional arguments for the constructor. Defaults to ().
+            kwargs (dict, optional): Keyword arguments for the constructor. Defaults to None.
+            setup (callable, optional): Called once with the new instance, e.g. to connect signals. Defaults to None.
+            cache (bool, optional): Whether to keep a dialog alive after it closes. Defaults to True.
+
+        Raises:
+            ValueError: If the target is not of the form "module:attr".
+        """
+        module_path, _, attr = target.partition(':')
+        if not module_path or not attr:
+            raise ValueError(f"Invalid panel target '{target}', expected 'module.path:ClassName'")
+
+        self._entries[name] = {
+            "module": module_path,
+            "attr": attr,
+            "args": tuple(args),
+            "kwargs": dict(kwargs or {}),
+            "setup": setup,
+            "cache": cache
+        }
+        self.unload(name)
+
+    def add_entry_point_group(self, group, args=(), kwargs=None):
+        """
+        Declare an entry point group to be scanned on demand.
+
+        Reading entry points walks the metadata of every installed
+        distribution, so the scan is deferred until a panel that is not
+        registered is requested or the panel list is needed.
+
+        Args:
+            group (str): The entry point group name.
+            args (tuple, optional): Positional arguments for each constructor. Defaults to ().
+            kwargs (dict, optional): Keyword arguments for each constructor. Defaults to None.
+        """
+        self._entry_point_groups.append((group, args, kwargs))
+
+    def _scan_entry_point_groups(self):
+        """
+        Register the panels of every pending entry point group.
+        """
+        while self._entry_point_groups:
+            group, args, kwargs = self._entry_point_groups.pop(0)
+            self.load_entry_points(group, args, kwargs)
+
+    def load_entry_points(self, group, args=(), kwargs=None):
+        """
+        Declare every panel advertised under an entry point group.
+
+        Only the entry point names and values are read, the panel modules
+        themselves are not imported. Names that are already registered are
+        skipped so plugins cannot replace built-in panels.
+
+        Args:
+            group (str): The entry point group name.
+            args (tuple, optional): Positional arguments for each constructor. Defaults to ().
+            kwargs (dict, optional): Keyword arguments for each constructor. Defaults to None.
+
+        Returns:
+            list: The names of the registered panels.
+        """
+        # importlib.metadata is slow to import, keep it off startup
+        from importlib.metadata import entry_points
+
+        names = []
+        for entry_point in entry_points(group=group):
+            if entry_point.name in self._entries:
+                print(f"Skipping panel '{entry_point.name}' from '{group}': name already registered")
+                continue
+            self.register(entry_point.name, entry_point.value, args, kwargs)
+            names.append(entry_point.name)
+        return names
+
+    def get_available_panels(self):
+        """
+        Get a list of registered panels.
+
+        Returns:
+            list: The registered panel names.
+        """
+        self._scan_entry_point_groups()
+        return list(self._entries)
+
+    def is_loaded(self, name):
+        """
+        Check whether a panel has already been constructed.
+
+        Args:
+            name (str): The name of the panel.
+
+        Returns:
+            bool: True if the panel instance exists, False otherwise.
+        """
+        return name in self._instances
+
+    def get(self, name):
+        """
+        Get a panel instance, importing and constructing it on first use.
+
+        Args:
+            name (str): The name of the panel.
+
+        Raises:
+            KeyError: If no panel is registered under the name.
+
+        Returns:
+            _type_: The panel instance.
+        """
+        if name in self._instances:
+            return self._instances[name]
+        if name not in self._entries:
+            self._scan_entry_point_groups()
+        if name not in self._entries:
+            raise KeyError(f"Panel '{name}' is not registered")
+
+        entry = self._entries[name]
+
+        start = time.perf_counter()
+        panel_class = getattr(importlib.import_module(entry["module"]), entry["attr"])
+        imported = time.perf_counter()
+        instance = panel_class(*entry["args"], **entry["kwargs"])
+        if entry["setup"] is not None:
+            entry["setup"](instance)
+        if self.host is not None and not hasattr(instance, 'exec'):
+            self.host(name, instance)
+        constructed = time.perf_counter()
+
+        self.timings[name] = {
+            "import": imported - start,
+            "construct": constructed - imported
+        }
+        self._instances[name] = instance
+        return instance
+
+    def show(self, name):
+        """
+        Show a panel, running it modally if it is a dialog.
+
+        Dialogs registered with cache=False are dropped once they close so
+        the next call builds a fresh instance.
+
+        Args:
+            name (str): The name of the panel.
+
+        Returns:
+            _type_: The dialog result for dialogs, otherwise None.
+        """
+        instance = self.get(name)
+        if hasattr(instance, 'exec'):
+            result = instance.exec()
+            if not self._entries[name]["cache"]:
+                self.unload(name)
+            return result
+        instance.show()
+        instance.raise_()
+        return None
+
+    def unload(self, name):
+        """
+        Drop a constructed panel so it is rebuilt the next time it is shown.
+
+        Args:
+            name (str): The name of the panel.
+        """
+        instance = self._instances.pop(name, None)
+        if instance is not None and hasattr(instance, 'deleteLater'):
+            instance.deleteLater()
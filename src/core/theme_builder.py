@@ -0,0 +1,209 @@
+# src/core/theme_builder.py
+import os
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from core.colors import COLOR_PATTERN
+from core.palette import contrast_ratio, hex_to_rgb
+from core.theme_cache import file_hash, is_rendered, load_manifest, render_info, save_manifest
+
+REQUIRED_COLORS = [
+    "primaryColor",
+    "primaryLightColor",
+    "secondaryColor",
+    "secondaryLightColor",
+    "secondaryDarkColor",
+    "primaryTextColor",
+    "secondaryTextColor"
+]
+
+# (text, background) pairs checked for readability
+CONTRAST_PAIRS = [
+    ("primaryTextColor", "primaryColor"),
+    ("secondaryTextColor", "secondaryColor")
+]
+
+def build_info(cache_dir, min_contrast=3.0):
+    """
+    Get the settings a cached theme depends on besides its XML.
+
+    Args:
+        cache_dir (str): The theme cache directory.
+        min_contrast (float, optional): The minimum text/background contrast ratio. Defaults to 3.0.
+
+    Returns:
+        dict: The build settings stored with every manifest entry.
+    """
+    return dict(render_info(cache_dir), min_contrast=min_contrast)
+
+def remove_artifacts(cache_dir, name):
+    """
+    Delete the cached stylesheet and icons of a theme.
+
+    Args:
+        cache_dir (str): The theme cache directory.
+        name (str): The name of the theme.
+    """
+    qss_file = os.path.join(cache_dir, f"{name}.qss")
+    if os.path.exists(qss_file):
+        os.remove(qss_file)
+    shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+
+def is_stale(entry, theme_file, cache_dir, info):
+    """
+    Check whether a cached theme needs to be rebuilt.
+
+    Args:
+        entry (dict): The manifest entry of the theme, or None.
+        theme_file (str): The path to the theme XML file.
+        cache_dir (str): The theme cache directory.
+        info (dict): The current build settings from build_info.
+
+    Returns:
+        bool: True if the theme must be rebuilt, False otherwise.
+    """
+    # Builds that raised may succeed on retry, e.g. after installing qt_material
+    if entry is None or entry.get("build_failed"):
+        return True
+    if "qss" in entry:
+        return not is_rendered(entry, theme_file, cache_dir, info)
+    # Validation failures repeat until the XML or the build settings change
+    if any(entry.get(key) != value for key, value in info.items()):
+        return True
+    return entry.get("hash") != file_hash(theme_file)
+
+def validate_theme(theme_file, min_contrast=3.0):
+    """
+    Validate a theme file.
+
+    Args:
+        theme_file (str): The path to the theme XML file.
+        min_contrast (float, optional): The minimum text/background contrast ratio. Defaults to 3.0.
+
+    Returns:
+        list: The validation errors, empty if the theme is valid.
+    """
+    try:
+        root = ET.parse(theme_file).getroot()
+    except ET.ParseError as e:
+        return [f"Invalid XML: {e}"]
+
+    colors = {color.attrib.get('name'): (color.text or '').strip() for color in root.findall('color')}
+
+    errors = [f"Missing color '{name}'" for name in REQUIRED_COLORS if name not in colors]
+    errors += [f"Unparseable color '{name}': '{value}'" for name, value in colors.items()
+               if name in REQUIRED_COLORS and not COLOR_PATTERN.match(value)]
+    if errors:
+        return errors
+
+    ratios = contrast_ratio(hex_to_rgb([colors[text_name] for text_name, _ in CONTRAST_PAIRS]),
+                            hex_to_rgb([colors[background_name] for _, background_name in CONTRAST_PAIRS]))
+    for (text_name, background_name), ratio in zip(CONTRAST_PAIRS, ratios):
+        if ratio < min_contrast:
+            errors.append(f"Low contrast between '{text_name}' and '{background_name}': {ratio:.2f} < {min_contrast}")
+    return errors
+
+def build_theme(theme_file, cache_dir, min_contrast=3.0):
+    """
+    Validate a theme and render its stylesheet and icons into the cache.
+
+    Args:
+        theme_file (str): The path to the theme XML file.
+        cache_dir (str): The theme cache directory.
+        min_contrast (float, optional): The minimum text/background contrast ratio. Defaults to 3.0.
+
+    Returns:
+        dict: The manifest entry for the theme.
+    """
+    name = os.path.splitext(os.path.basename(theme_file))[0]
+    entry = {"hash": file_hash(theme_file), "errors": validate_theme(theme_file, min_contrast)}
+    if entry["errors"]:
+        return entry
+
+    # Imported here so the worker processes do not need a running QApplication
+    from qt_material import export_theme
+
+    cache_dir = os.path.abspath(cache_dir)
+    icons_dir = os.path.join(cache_dir, name)
+    qss_file = os.path.join(cache_dir, f"{name}.qss")
+    export_theme(
+        theme=os.path.abspath(theme_file),
+        qss=qss_file,
+        output=icons_dir,
+        prefix=icons_dir.replace(os.sep, '/') + '/',
+        extra={"pyqt6": True}
+    )
+
+    with open(qss_file) as f:
+        stylesheet = f.read()
+    with open(qss_file, 'w') as f:
+        f.write(minify_stylesheet(stylesheet))
+
+    entry["qss"] = f"{name}.qss"
+    return entry
+
+def minify_stylesheet(stylesheet):
+    """
+    Strip comments and redundant whitespace from a stylesheet.
+
+    Args:
+        stylesheet (str): The stylesheet to minify.
+
+    Returns:
+        str: The minified stylesheet.
+    """
+    stylesheet = re.sub(r'/\*.*?\*/', '', stylesheet, flags=re.DOTALL)
+    stylesheet = re.sub(r'\s+', ' ', stylesheet)
+    stylesheet = re.sub(r'\s*([{};])\s*', r'\1', stylesheet)
+    return stylesheet.strip()
+
+def build_themes(themes_dir, cache_dir, jobs=None, force=False, min_contrast=3.0):
+    """
+    Build every theme whose XML changed since the last build.
+
+    Args:
+        themes_dir (str): The directory containing the theme XML files.
+        cache_dir (str): The theme cache directory.
+        jobs (int, optional): The number of worker processes. Defaults to the CPU count.
+        force (bool, optional): Whether to rebuild unchanged themes. Defaults to False.
+        min_contrast (float, optional): The minimum text/background contrast ratio. Defaults to 3.0.
+
+    Returns:
+        tuple: The manifest and the list of rebuilt theme names.
+    """
+    manifest = load_manifest(cache_dir)
+    info = build_info(cache_dir, min_contrast)
+    theme_files = {os.path.splitext(f)[0]: os.path.join(themes_dir, f)
+                   for f in sorted(os.listdir(themes_dir)) if f.endswith('.xml')}
+
+    # Drop themes that no longer exist
+    for name in set(manifest) - set(theme_files):
+        del manifest[name]
+        remove_artifacts(cache_dir, name)
+
+    stale = [name for name, theme_file in theme_files.items()
+             if force or is_stale(manifest.get(name), theme_file, cache_dir, info)]
+
+    # Old artifacts must not outlive a rebuild that now fails
+    for name in stale:
+        manifest.pop(name, None)
+        remove_artifacts(cache_dir, name)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {name: executor.submit(build_theme, theme_files[name], cache_dir, min_contrast)
+                       for name in stale}
+            for name, future in futures.items():
+                try:
+                    manifest[name] = future.result()
+                except Exception as e:
+                    manifest[name] = {
+                        "hash": file_hash(theme_files[name]),
+                        "errors": [f"Build failed: {e}"],
+                        "build_failed": True
+                    }
+                manifest[name].update(info)
+
+    save_manifest(cache_dir, manifest)
+    return manifest, stale
@@ -0,0 +1,93 @@
+# src/core/theme_cache.py
+import hashlib
+import json
+import os
+
+MANIFEST_FILE = "manifest.json"
+
+def file_hash(file):
+    """
+    Compute the SHA-256 hash of a file.
+
+    Args:
+        file (str): The path to the file.
+
+    Returns:
+        str: The hex digest of the file contents.
+    """
+    with open(file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_manifest(cache_dir):
+    """
+    Load the build manifest of a theme cache.
+
+    Args:
+        cache_dir (str): The theme cache directory.
+
+    Returns:
+        dict: The manifest entries keyed by theme name.
+    """
+    manifest_file = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_file):
+        return {}
+    try:
+        with open(manifest_file) as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return {}
+
+def save_manifest(cache_dir, manifest):
+    """
+    Save the build manifest of a theme cache.
+
+    Args:
+        cache_dir (str): The theme cache directory.
+        manifest (dict): The manifest entries keyed by theme name.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+
+def render_info(cache_dir):
+    """
+    Get the settings a rendered stylesheet depends on besides its XML.
+
+    The stylesheet embeds absolute icon paths, so moving the cache
+    invalidates it just like upgrading qt_material does.
+
+    Args:
+        cache_dir (str): The theme cache directory.
+
+    Returns:
+        dict: The render settings stored with every manifest entry.
+    """
+    # importlib.metadata is slow to import and only needed once a cache exists
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        qt_material_version = version("qt-material")
+    except PackageNotFoundError:
+        qt_material_version = None
+    return {"qt_material": qt_material_version, "cache_dir": os.path.abspath(cache_dir)}
+
+def is_rendered(entry, theme_file, cache_dir, info):
+    """
+    Check whether a manifest entry holds an up to date stylesheet.
+
+    Args:
+        entry (dict): The manifest entry of the theme, or None.
+        theme_file (str): The path to the theme XML file.
+        cache_dir (str): The theme cache directory.
+        info (dict): The current settings from render_info or build_info.
+
+    Returns:
+        bool: True if the cached stylesheet can be used, False otherwise.
+    """
+    if entry is None or "qss" not in entry or not os.path.exists(theme_file):
+        return False
+    if any(entry.get(key) != value for key, value in info.items()):
+        return False
+    if entry.get("hash") != file_hash(theme_file):
+        return False
+    return os.path.exists(os.path.join(cache_dir, entry["qss"]))
@@ -1,6 +1,8 @@
 # src/core/theme_manager.py
 import os
 import xml.etree.ElementTree as ET
+from core.colors import COLOR_PATTERN
+from core.theme_cache import is_rendered, load_manifest, render_info
 
 class ThemeManager:
     def __init__(self, settings):
@@ -13,6 +15,7 @@ class ThemeManager:
         
         self.settings = settings
         self.themes_dir = os.path.join(os.path.dirname(__file__), '..', 'resources', 'themes')
+        self.cache_dir = os.path.join(os.path.dirname(__file__), '..', 'resources', 'theme_cache')
         self.current_theme = self.settings.get("theme", "light")
         self.ensure_default_themes()
 
@@ -98,6 +101,31 @@ class ThemeManager:
             return {color.attrib['name']: color.text for color in root.findall('color')}
         return {}
 
+    def get_cached_stylesheet(self, theme_name=None):
+        """
+        Get the pre-rendered stylesheet of a theme built by build_themes.py.
+
+        Args:
+            theme_name (_type_, optional): The name of the theme. Defaults to None.
+
+        Returns:
+            _type_: The stylesheet, or None if the cache is missing or out of date.
+        """
+        
+        if theme_name is None:
+            theme_name = self.current_theme
+        
+        theme_file = os.path.join(self.themes_dir, f"{theme_name}.xml")
+        entry = load_manifest(self.cache_dir).get(theme_name)
+        if entry is None or "qss" not in entry:
+            return None
+        if not is_rendered(entry, theme_file, self.cache_dir, render_info(self.cache_dir)):
+            return None
+        
+        qss_file = os.path.join(self.cache_dir, entry["qss"])
+        with open(qss_file) as f:
+            return f.read()
+
     def save_theme(self, name, colors):
         """
         Save the theme to a file.
@@ -116,6 +144,51 @@ class ThemeManager:
         tree = ET.ElementTree(root)
         tree.write(theme_file, encoding="UTF-8", xml_declaration=True)
 
+    def derive_themes(self, theme_names=None):
+        """
+        Re-derive the colors of themes from their primary and secondary colors.
+
+        Themes that are not valid XML, or whose primary or secondary color is
+        missing or not of the form '#rrggbb', are skipped and left untouched.
+
+        Args:
+            theme_names (_type_, optional): The names of the themes to re-derive. Defaults to all themes.
+
+        Returns:
+            _type_: A tuple of the re-derived and the skipped theme names.
+        """
+        
+        # NumPy is only needed here, keep it off the startup path
+        from core.palette import generate_palettes
+        
+        if theme_names is None:
+            theme_names = self.get_available_themes()
+        
+        themes = {}
+        skipped = []
+        for name in theme_names:
+            try:
+                colors = self.get_theme_colors(name)
+            except ET.ParseError:
+                skipped.append(name)
+                continue
+            base_colors = [(colors.get(key) or '').strip() for key in ("primaryColor", "secondaryColor")]
+            if all(COLOR_PATTERN.match(color) for color in base_colors):
+                colors["primaryColor"], colors["secondaryColor"] = base_colors
+                themes[name] = colors
+            else:
+                skipped.append(name)
+        if not themes:
+            return [], skipped
+        
+        # All colors are generated before any theme is written
+        palettes = generate_palettes([colors["primaryColor"] for colors in themes.values()],
+                                     [colors["secondaryColor"] for colors in themes.values()])
+        for i, (name, colors) in enumerate(themes.items()):
+            colors.update({color_name: str(values[i]) for color_name, values in palettes.items()})
+            self.save_theme(name, colors)
+        return list(themes), skipped
+
     def get_available_themes(self):
         """
         Get a list of available themes
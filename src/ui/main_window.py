@@ -1,11 +1,11 @@
 # src/ui/main_window.py
 import os
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QColor, QPalette
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QMenuBar, QMenu
-from qt_material import apply_stylesheet
+from qt_material import apply_stylesheet, add_fonts
 from core.theme_manager import ThemeManager
 from core.settings import Settings
-from widgets.settings_widget import SettingsWidget
+from core.panel_registry import PanelRegistry
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -15,8 +15,27 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.settings = Settings()
         self.theme_manager = ThemeManager(self.settings)
+        self.panels = PanelRegistry(host=self.add_panel)
+        self.panel_actions = {}
+        self.register_panels()
         self.init_ui()
 
+    def register_panels(self):
+        """
+        Declare the panels and dialogs of the main window.
+
+        Panels are only imported and constructed the first time they are shown.
+        Panels published under the "pyqt6_template.panels" entry point group
+        are constructed with the main window as their only argument.
+        """
+        self.panels.register(
+            "settings", "widgets.settings_widget:SettingsWidget",
+            args=(self.settings, self.theme_manager, self),
+            setup=lambda dialog: dialog.settingsChanged.connect(self.apply_settings),
+            cache=False
+        )
+        self.panels.add_entry_point_group("pyqt6_template.panels", args=(self,))
+
     def init_ui(self):
         """
         Initialize the user interface.
@@ -28,7 +47,7 @@ class MainWindow(QMainWindow):
         self.resize(size["width"], size["height"])
 
         central_widget = QWidget()
-        layout = QVBoxLayout()
+        self.panel_layout = QVBoxLayout()
 
         # Create menu bar
         menu_bar = QMenuBar()
@@ -37,9 +56,15 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.open_settings)
         file_menu.addAction(settings_action)
         menu_bar.addMenu(file_menu)
+        self.panel_actions["settings"] = settings_action
+
+        # Filled when first opened so plugin discovery stays off startup
+        self.view_menu = QMenu("View", self)
+        self.view_menu.aboutToShow.connect(self.populate_view_menu)
+        menu_bar.addMenu(self.view_menu)
         self.setMenuBar(menu_bar)
 
-        central_widget.setLayout(layout)
+        central_widget.setLayout(self.panel_layout)
         self.setCentralWidget(central_widget)
 
         self.apply_theme(self.theme_manager.get_current_theme())
@@ -55,6 +80,21 @@ class MainWindow(QMainWindow):
         if theme_name not in available_themes:
             theme_name = available_themes[0]
         
+        # Use the stylesheet pre-rendered by build_themes.py when it is up to date
+        stylesheet = self.theme_manager.get_cached_stylesheet(theme_name)
+        if stylesheet is not None:
+            add_fonts()
+            # Mirror the placeholder text palette qt_material sets when rendering
+            primary_color = self.theme_manager.get_theme_colors(theme_name).get("primaryColor")
+            if primary_color:
+                color = QColor(primary_color)
+                color.setAlpha(92)
+                palette = QApplication.palette()
+                palette.setColor(QPalette.ColorRole.Text, color)
+                QApplication.setPalette(palette)
+            QApplication.instance().setStyleSheet(stylesheet)
+            return
+        
         theme_file = os.path.join(os.path.dirname(__file__), '..', 'resources', 'themes', f"{theme_name}.xml")
         
         if os.path.exists(theme_file):
@@ -69,13 +109,33 @@ class MainWindow(QMainWindow):
             # Fallback to a default theme if the file doesn't exist
             apply_stylesheet(QApplication.instance(), theme='light_blue.xml')
 
+    def populate_view_menu(self):
+        """
+        Add an action for every registered panel that does not have one yet.
+        """
+        for name in self.panels.get_available_panels():
+            if name in self.panel_actions:
+                continue
+            action = QAction(name.replace('_', ' ').title(), self)
+            action.triggered.connect(lambda checked, name=name: self.panels.show(name))
+            self.view_menu.addAction(action)
+            self.panel_actions[name] = action
+
+    def add_panel(self, name, panel):
+        """
+        Place a newly constructed panel in the central widget.
+
+        Args:
+            name (str): The name of the panel.
+            panel (QWidget): The panel instance.
+        """
+        self.panel_layout.addWidget(panel)
+
     def open_settings(self):
         """
         Open the settings dialog.
         """
-        settings_dialog = SettingsWidget(self.settings, self.theme_manager, self)
-        settings_dialog.settingsChanged.connect(self.apply_settings)
-        settings_dialog.exec()
+        self.panels.show("settings")
 
     def apply_settings(self):
         """
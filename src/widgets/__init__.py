@@ -1,2 +1,18 @@
-from .theme_editor_widget import ThemeEditorWidget
-from .scrollable_widget import ScrollableWidget
\ No newline at end of file
+import importlib
+
+_LAZY_WIDGETS = {
+    "ThemeEditorWidget": ".theme_editor_widget",
+    "ScrollableWidget": ".scrollable_widget",
+    "SettingsWidget": ".settings_widget"
+}
+
+def __getattr__(name):
+    """
+    Import widget modules on first attribute access.
+    """
+    if name in _LAZY_WIDGETS:
+        module = importlib.import_module(_LAZY_WIDGETS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_LAZY_WIDGETS)
\ No newline at end of file
@@ -88,6 +88,11 @@ class ThemeEditorWidget(QWidget):
 
         layout.addLayout(colors_layout)
 
+        # Derive button
+        derive_btn = QPushButton("Derive From Primary/Secondary")
+        derive_btn.clicked.connect(self.derive_colors)
+        layout.addWidget(derive_btn)
+
         # Save button
         save_btn = QPushButton("Save Theme")
         save_btn.clicked.connect(self.save_theme)
@@ -120,6 +125,21 @@ class ThemeEditorWidget(QWidget):
         if color.isValid():
             self.color_buttons[color_name].setColor(color.name())
 
+    def derive_colors(self):
+        """
+        Derive the remaining colors from the primary and secondary colors.
+        """
+        # NumPy is only needed here, keep it out of the settings dialog
+        from core.palette import generate_palette
+
+        if "primaryColor" not in self.color_buttons or "secondaryColor" not in self.color_buttons:
+            return
+        palette = generate_palette(QColor(self.color_buttons["primaryColor"].color).name(),
+                                   QColor(self.color_buttons["secondaryColor"].color).name())
+        for color_name, color_value in palette.items():
+            if color_name in self.color_buttons:
+                self.color_buttons[color_name].setColor(color_value)
+
     def save_theme(self):
         """
         Save the current theme to the theme file.
@@ -0,0 +1,70 @@
+import sys
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.palette import contrast_ratio, generate_palette, generate_palettes, hex_to_rgb, rgb_to_hex, text_colors
+from core.theme_manager import ThemeManager
+
+class DummySettings(dict):
+    def set(self, key, value):
+        self[key] = value
+
+def test_hex_round_trip():
+    colors = ["#000000", "#ffffff", "#123456", "#abcdef"]
+    assert list(rgb_to_hex(hex_to_rgb(colors))) == colors
+
+def test_hex_to_rgb_strips_whitespace():
+    assert hex_to_rgb([" #123456\n"]).tolist() == [[18, 52, 86]]
+
+@pytest.mark.parametrize("colors", [["#fff", "#000", "#123456"], ["red"], ["#12345g"]])
+def test_hex_to_rgb_rejects_other_forms(colors):
+    with pytest.raises(ValueError):
+        hex_to_rgb(colors)
+
+def test_contrast_ratio():
+    ratios = contrast_ratio(hex_to_rgb(["#000000", "#123456", "#ffffff"]), hex_to_rgb(["#ffffff", "#123456", "#000000"]))
+    assert ratios.round(2).tolist() == [21.0, 1.0, 21.0]
+
+def test_text_colors_pick_higher_contrast():
+    backgrounds = hex_to_rgb(["#ffffff", "#000000", "#2979ff", "#1a237e", "#767676", "#757575"])
+    # #767676 and #757575 sit on either side of the black/white crossover
+    assert list(text_colors(backgrounds)) == ["#000000", "#ffffff", "#000000", "#ffffff", "#000000", "#ffffff"]
+
+def test_generate_palettes_matches_single():
+    primary = ["#2979ff", "#1a237e"]
+    secondary = ["#f5f5f5", "#212121"]
+    palettes = generate_palettes(primary, secondary)
+    for i in range(2):
+        single = generate_palette(primary[i], secondary[i])
+        assert {name: str(colors[i]) for name, colors in palettes.items()} == single
+
+def test_generate_palette_variants():
+    palette = generate_palette("#808080", "#808080", light_amount=0.5, dark_amount=0.5)
+    assert palette["primaryLightColor"] == "#c0c0c0"
+    assert palette["secondaryDarkColor"] == "#404040"
+
+def test_generate_palettes_length_mismatch():
+    with pytest.raises(ValueError):
+        generate_palettes(["#000000"], [])
+
+def test_derive_themes_skips_invalid_before_saving(tmp_path):
+    manager = ThemeManager(DummySettings())
+    manager.themes_dir = str(tmp_path)
+    manager.save_theme("short", {"primaryColor": "#fff", "secondaryColor": "#000000"})
+    manager.save_theme("named", {"primaryColor": "red", "secondaryColor": "#000000"})
+    manager.save_theme("good", {"primaryColor": " #2979ff ", "secondaryColor": "#f5f5f5"})
+    (tmp_path / "broken.xml").write_text("<resources>")
+
+    derived, skipped = manager.derive_themes(["short", "broken", "named", "good"])
+    assert derived == ["good"]
+    assert skipped == ["short", "broken", "named"]
+    assert (tmp_path / "broken.xml").read_text() == "<resources>"
+    assert manager.get_theme_colors("short") == {"primaryColor": "#fff", "secondaryColor": "#000000"}
+    assert manager.get_theme_colors("good") == generate_palette("#2979ff", "#f5f5f5")
+
+def test_theme_manager_does_not_import_numpy(monkeypatch):
+    for name in ["core.palette", "numpy"]:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    ThemeManager(DummySettings())
+    assert "core.palette" not in sys.modules
@@ -0,0 +1,146 @@
+import importlib
+import sys
+import pytest
+from core.panel_registry import PanelRegistry
+
+PANEL_MODULE = """
+class Panel:
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        Panel.instances += 1
+        self.args = args
+        self.kwargs = kwargs
+        self.deleted = False
+        self.shown = False
+
+    def show(self):
+        self.shown = True
+
+    def raise_(self):
+        pass
+
+    def deleteLater(self):
+        self.deleted = True
+
+class Dialog(Panel):
+    def exec(self):
+        return 1
+"""
+
+@pytest.fixture
+def panel_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_panels.py").write_text(PANEL_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_panels"
+    sys.modules.pop("lazy_panels", None)
+
+def test_register_does_not_import(panel_module):
+    registry = PanelRegistry()
+    registry.register("panel", f"{panel_module}:Panel")
+    assert panel_module not in sys.modules
+    assert not registry.is_loaded("panel")
+    assert registry.timings == {}
+
+def test_get_constructs_once_and_records_timings(panel_module):
+    registry = PanelRegistry()
+    registry.register("panel", f"{panel_module}:Panel", args=(1,), kwargs={"a": 2})
+    panel = registry.get("panel")
+    assert registry.get("panel") is panel
+    assert panel.args == (1,) and panel.kwargs == {"a": 2}
+    assert sys.modules[panel_module].Panel.instances == 1
+    assert set(registry.timings["panel"]) == {"import", "construct"}
+
+def test_setup_runs_once(panel_module):
+    calls = []
+    registry = PanelRegistry()
+    registry.register("panel", f"{panel_module}:Panel", setup=calls.append)
+    panel = registry.get("panel")
+    registry.get("panel")
+    assert calls == [panel]
+
+def test_show_panel(panel_module):
+    registry = PanelRegistry()
+    registry.register("panel", f"{panel_module}:Panel")
+    assert registry.show("panel") is None
+    assert registry.get("panel").shown
+
+def test_uncached_dialog_is_rebuilt_after_closing(panel_module):
+    registry = PanelRegistry()
+    registry.register("dialog", f"{panel_module}:Dialog", cache=False)
+    assert registry.show("dialog") == 1
+    assert not registry.is_loaded("dialog")
+    first = registry.get("dialog")
+    registry.show("dialog")
+    assert first.deleted
+    assert registry.get("dialog") is not first
+
+def test_cached_dialog_is_kept(panel_module):
+    registry = PanelRegistry()
+    registry.register("dialog", f"{panel_module}:Dialog")
+    registry.show("dialog")
+    assert registry.is_loaded("dialog")
+
+def test_reregister_deletes_instance(panel_module):
+    registry = PanelRegistry()
+    registry.register("panel", f"{panel_module}:Panel")
+    panel = registry.get("panel")
+    registry.register("panel", f"{panel_module}:Dialog")
+    assert panel.deleted
+    assert not registry.is_loaded("panel")
+
+def test_invalid_target():
+    with pytest.raises(ValueError):
+        PanelRegistry().register("panel", "no_class_here")
+
+def test_unknown_panel():
+    with pytest.raises(KeyError):
+        PanelRegistry().get("missing")
+
+def test_entry_point_groups_are_scanned_lazily(panel_module, monkeypatch):
+    scanned = []
+
+    class EntryPoint:
+        name = "plugin"
+        value = f"{panel_module}:Panel"
+
+    def fake_entry_points(group):
+        scanned.append(group)
+        return [EntryPoint()]
+
+    monkeypatch.setattr("importlib.metadata.entry_points", fake_entry_points)
+    registry = PanelRegistry()
+    registry.add_entry_point_group("test.panels", args=("window",))
+    assert scanned == []
+    assert registry.get("plugin").args == ("window",)
+    assert registry.get_available_panels() == ["plugin"]
+    assert scanned == ["test.panels"]
+
+def test_host_places_panels_but_not_dialogs(panel_module):
+    placed = []
+    registry = PanelRegistry(host=lambda name, instance: placed.append(name))
+    registry.register("panel", f"{panel_module}:Panel")
+    registry.register("dialog", f"{panel_module}:Dialog")
+    registry.show("panel")
+    registry.show("panel")
+    registry.show("dialog")
+    assert placed == ["panel"]
+
+def test_entry_points_do_not_replace_registered_panels(panel_module, monkeypatch):
+    class EntryPoint:
+        name = "settings"
+        value = f"{panel_module}:Dialog"
+
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group: [EntryPoint()])
+    registry = PanelRegistry()
+    registry.register("settings", f"{panel_module}:Panel")
+    panel = registry.get("settings")
+    assert registry.load_entry_points("test.panels") == []
+    assert registry.get("settings") is panel
+    assert not panel.deleted
+
+def test_import_does_not_load_metadata(monkeypatch):
+    for name in ["core.panel_registry", "importlib.metadata"]:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    importlib.import_module("core.panel_registry")
+    assert "importlib.metadata" not in sys.modules
@@ -0,0 +1,111 @@
+import json
+import os
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.theme_builder import build_info, build_themes, is_stale, minify_stylesheet, validate_theme
+from core.theme_cache import file_hash, load_manifest, save_manifest
+
+COLORS = {
+    "primaryColor": "#2979ff",
+    "primaryLightColor": "#75a7ff",
+    "secondaryColor": "#f5f5f5",
+    "secondaryLightColor": "#ffffff",
+    "secondaryDarkColor": "#e6e6e6",
+    "primaryTextColor": "#000000",
+    "secondaryTextColor": "#000000"
+}
+
+def write_theme(path, colors):
+    body = ''.join(f'<color name="{name}">{value}</color>' for name, value in colors.items())
+    path.write_text(f"<?xml version='1.0' encoding='UTF-8'?><resources>{body}</resources>")
+    return str(path)
+
+def test_valid_theme(tmp_path):
+    assert validate_theme(write_theme(tmp_path / "light.xml", COLORS)) == []
+
+def test_missing_and_unparseable_colors(tmp_path):
+    colors = dict(COLORS, primaryColor="#fff")
+    del colors["secondaryColor"]
+    errors = validate_theme(write_theme(tmp_path / "bad.xml", colors))
+    assert "Missing color 'secondaryColor'" in errors
+    assert "Unparseable color 'primaryColor': '#fff'" in errors
+
+def test_invalid_xml(tmp_path):
+    theme_file = tmp_path / "broken.xml"
+    theme_file.write_text("<resources>")
+    assert validate_theme(str(theme_file))[0].startswith("Invalid XML")
+
+def test_low_contrast(tmp_path):
+    theme_file = write_theme(tmp_path / "red.xml", dict(COLORS, primaryColor="#ff2525", primaryTextColor="#ffffff"))
+    assert validate_theme(theme_file, min_contrast=3.0) == []
+    assert len(validate_theme(theme_file, min_contrast=4.5)) == 1
+
+def test_minify_stylesheet():
+    stylesheet = "/* comment */\nQWidget {\n    color: #000000;\n}\n\nQPushButton:hover {\n  color: red;\n}\n"
+    assert minify_stylesheet(stylesheet) == "QWidget{color: #000000;}QPushButton:hover{color: red;}"
+
+def test_is_stale(tmp_path):
+    theme_file = write_theme(tmp_path / "light.xml", COLORS)
+    (tmp_path / "light.qss").write_text("")
+    info = build_info(str(tmp_path), 3.0)
+    entry = dict(info, hash=file_hash(theme_file), errors=[], qss="light.qss")
+
+    assert not is_stale(entry, theme_file, str(tmp_path), info)
+    assert is_stale(None, theme_file, str(tmp_path), info)
+    assert is_stale(dict(entry, hash="other"), theme_file, str(tmp_path), info)
+    assert is_stale(entry, theme_file, str(tmp_path), build_info(str(tmp_path), 4.5))
+    assert is_stale(dict(entry, qt_material="0.0"), theme_file, str(tmp_path), info)
+    # The stylesheet embeds absolute icon paths
+    assert is_stale(dict(entry, cache_dir="/moved"), theme_file, str(tmp_path), info)
+
+    # Validation failures are only retried when something changed, build failures always
+    invalid = dict(info, hash=file_hash(theme_file), errors=["Missing color 'primaryColor'"])
+    assert not is_stale(invalid, theme_file, str(tmp_path), info)
+    assert is_stale(invalid, theme_file, str(tmp_path), build_info(str(tmp_path), 4.5))
+    failed = dict(invalid, errors=["Build failed: boom"], build_failed=True)
+    assert is_stale(failed, theme_file, str(tmp_path), info)
+
+    os.remove(tmp_path / "light.qss")
+    assert is_stale(entry, theme_file, str(tmp_path), info)
+
+def test_build_records_settings_and_skips_unchanged_invalid(tmp_path):
+    themes_dir = tmp_path / "themes"
+    cache_dir = tmp_path / "cache"
+    themes_dir.mkdir()
+    write_theme(themes_dir / "bad.xml", dict(COLORS, primaryColor="red"))
+
+    manifest, rebuilt = build_themes(str(themes_dir), str(cache_dir), jobs=1, min_contrast=4.5)
+    assert rebuilt == ["bad"]
+    assert manifest["bad"]["errors"]
+    assert manifest["bad"]["min_contrast"] == 4.5
+    assert load_manifest(str(cache_dir)) == json.loads(json.dumps(manifest))
+
+    _, rebuilt = build_themes(str(themes_dir), str(cache_dir), jobs=1, min_contrast=4.5)
+    assert rebuilt == []
+
+    _, rebuilt = build_themes(str(themes_dir), str(cache_dir), jobs=1, min_contrast=3.0)
+    assert rebuilt == ["bad"]
+
+def test_build_removes_stale_artifacts(tmp_path):
+    themes_dir = tmp_path / "themes"
+    cache_dir = tmp_path / "cache"
+    themes_dir.mkdir()
+    cache_dir.mkdir()
+    write_theme(themes_dir / "bad.xml", dict(COLORS, primaryColor="red"))
+
+    # A previously valid theme that now fails and one that was deleted
+    for name in ["bad", "gone"]:
+        (cache_dir / f"{name}.qss").write_text("QWidget{}")
+        (cache_dir / name).mkdir()
+    info = build_info(str(cache_dir))
+    save_manifest(str(cache_dir), {
+        "bad": dict(info, hash="old", errors=[], qss="bad.qss"),
+        "gone": dict(info, hash="old", errors=[], qss="gone.qss")
+    })
+
+    manifest, _ = build_themes(str(themes_dir), str(cache_dir), jobs=1)
+    assert set(manifest) == {"bad"}
+    assert "qss" not in manifest["bad"]
+    assert sorted(os.listdir(cache_dir)) == ["manifest.json"]
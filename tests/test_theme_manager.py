@@ -0,0 +1,36 @@
+import pytest
+from core.theme_cache import file_hash, render_info, save_manifest
+from core.theme_manager import ThemeManager
+
+class DummySettings(dict):
+    def set(self, key, value):
+        self[key] = value
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ThemeManager(DummySettings())
+    manager.themes_dir = str(tmp_path / "themes")
+    manager.cache_dir = str(tmp_path / "cache")
+    manager.ensure_default_themes()
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "light.qss").write_text("QWidget{}")
+    return manager
+
+def write_entry(manager, **overrides):
+    theme_file = f"{manager.themes_dir}/light.xml"
+    entry = dict(render_info(manager.cache_dir), hash=file_hash(theme_file), errors=[], qss="light.qss")
+    entry.update(overrides)
+    save_manifest(manager.cache_dir, {"light": entry})
+
+def test_cached_stylesheet(manager):
+    write_entry(manager)
+    assert manager.get_cached_stylesheet("light") == "QWidget{}"
+
+def test_no_cache(manager):
+    assert manager.get_cached_stylesheet("light") is None
+    assert manager.get_cached_stylesheet("dark") is None
+
+@pytest.mark.parametrize("overrides", [{"hash": "other"}, {"qt_material": "0.0"}, {"cache_dir": "/moved"}])
+def test_outdated_cache_is_ignored(manager, overrides):
+    write_entry(manager, **overrides)
+    assert manager.get_cached_stylesheet("light") is None